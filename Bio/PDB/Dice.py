@@ -10,14 +10,11 @@
 This module is used internally by the Bio.PDB.extract() function.
 """
 
-import re
 import warnings
 
 from Bio.PDB.PDBIO import PDBIO
 from Bio import BiopythonWarning
 
-_hydrogen = re.compile("[123 ]*H.*")
-
 
 class ChainSelector:
     """Only accepts residues with right chainid, between start and end.
@@ -62,9 +59,9 @@ class ChainSelector:
 
     def accept_atom(self, atom):
         """Verify if atoms are not Hydrogen."""
-        # atoms - get rid of hydrogens
-        name = atom.get_id()
-        if _hydrogen.match(name):
+        # atoms - get rid of hydrogens, i.e. names matching "[123 ]*H.*"
+        name = atom.get_id().lstrip("123 ")
+        if name and name[0] == "H":
             return 0
         else:
             return 1
@@ -299,6 +299,10 @@ class PDBIO(StructureIO):
         Typically select is a subclass of L{Select}.
         """
         get_atom_line = self._get_atom_line
+        accept_model = select.accept_model
+        accept_chain = select.accept_chain
+        accept_residue = select.accept_residue
+        accept_atom = select.accept_atom
         if isinstance(file, str):
             fp = open(file, "w")
             close_file = 1
@@ -312,7 +316,7 @@ class PDBIO(StructureIO):
         else:
             model_flag = 0
         for model in self.structure.get_list():
-            if not select.accept_model(model):
+            if not accept_model(model):
                 continue
             # necessary for ENDMDL
             # do not write ENDMDL if no residues were written
@@ -323,7 +327,7 @@ class PDBIO(StructureIO):
             if model_flag:
                 fp.write("MODEL      %s\n" % model.serial_num)
             for chain in model.get_list():
-                if not select.accept_chain(chain):
+                if not accept_chain(chain):
                     continue
                 chain_id = chain.get_id()
                 # necessary for TER
@@ -331,13 +335,13 @@ class PDBIO(StructureIO):
                 # for this chain
                 chain_residues_written = 0
                 for residue in chain.get_unpacked_list():
-                    if not select.accept_residue(residue):
+                    if not accept_residue(residue):
                         continue
                     hetfield, resseq, icode = residue.get_id()
                     resname = residue.get_resname()
                     segid = residue.get_segid()
                     for atom in residue.get_unpacked_list():
-                        if select.accept_atom(atom):
+                        if accept_atom(atom):
                             chain_residues_written = 1
                             model_residues_written = 1
                             if preserve_atom_numbering: